@@ -8,16 +8,22 @@ Usage:
     python generate_layer2_results.py
 """
 
+import io
+import os
 import sys
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from multiprocessing import Pool
 from pathlib import Path
 
-# Add model to path
+# Add the repository root to path (the model is imported as layer2_sim.model)
 current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir / "layer2_sim"))
+sys.path.insert(0, str(current_dir))
 
-from model.model import DisinformationModel
-from model.archetypes import ARCHETYPES
-from analysis.export import (
+from layer2_sim.model.model import DisinformationModel
+from layer2_sim.model.archetypes import ARCHETYPES
+from layer2_sim.analysis.export import (
+    _init_worker,
     export_simulation_results,
     create_baseline_comparison_table,
     format_thesis_table
@@ -141,6 +147,59 @@ def run_narrative(narrative_name: str, params: dict):
     return model
 
 
+@dataclass
+class NarrativeResult:
+    """
+    Picklable summary of a finished narrative run.
+    
+    Mesa models don't pickle cleanly, so worker processes send back this
+    summary instead. It exposes the model methods used by the comparison
+    table, LaTeX export and key findings.
+    """
+    population: int
+    current_step: int
+    cumulative_infected: int
+    total_relapses: int
+    R0: float
+    R0_components: dict
+    peak_metrics: dict
+    profile_metrics: dict
+    log: str = ""
+    
+    @classmethod
+    def from_model(cls, model: DisinformationModel, log: str = "") -> 'NarrativeResult':
+        R0, components = model.calculate_R0()
+        return cls(
+            population=model.population,
+            current_step=model.current_step,
+            cumulative_infected=model.cumulative_infected,
+            total_relapses=model.total_relapses,
+            R0=R0,
+            R0_components=components,
+            peak_metrics=model.get_peak_metrics(),
+            profile_metrics=model.get_profile_stratified_metrics(),
+            log=log
+        )
+    
+    def calculate_R0(self) -> tuple[float, dict]:
+        return self.R0, self.R0_components
+    
+    def get_peak_metrics(self) -> dict:
+        return self.peak_metrics
+    
+    def get_profile_stratified_metrics(self) -> dict:
+        return self.profile_metrics
+
+
+def _run_narrative_worker(item: tuple[str, dict]) -> NarrativeResult:
+    """Pool worker: run one narrative, capturing its console output."""
+    narrative_name, params = item
+    log = io.StringIO()
+    with redirect_stdout(log):
+        model = run_narrative(narrative_name, params)
+    return NarrativeResult.from_model(model, log.getvalue())
+
+
 def main():
     """Main execution"""
     print("""
@@ -153,10 +212,14 @@ def main():
     # Create results directory
     Path("results").mkdir(exist_ok=True)
     
-    # Run all narratives
-    models = {}
-    for narrative_name, params in NARRATIVES.items():
-        models[narrative_name] = run_narrative(narrative_name, params)
+    # Run all narratives (independent, so one process each, one Numba thread per process)
+    n_workers = min(len(NARRATIVES), os.cpu_count() or 1)
+    with Pool(n_workers, initializer=_init_worker) as pool:
+        results = pool.map(_run_narrative_worker, NARRATIVES.items())
+    
+    models = dict(zip(NARRATIVES.keys(), results))
+    for result in results:
+        print(result.log, end="")
     
     # Create comparison table
     print(f"\n{'='*60}")
@@ -199,10 +262,14 @@ def main():
     relapses = {}
     for name, model in models.items():
         total_infections = model.cumulative_infected
-        total_relapses = sum(a.relapse_count for a in model.agents)
+        total_relapses = model.total_relapses
         relapses[name] = total_relapses / total_infections if total_infections > 0 else 0
     highest_relapse = max(relapses, key=relapses.get)
     
+    # Profile metrics, computed once per narrative
+    profiles = {name: model.get_profile_stratified_metrics() 
+                for name, model in models.items()}
+    
     print(f"""
 1. {highest_peak} showed highest peak prevalence ({peaks[highest_peak]:.1%})
    - Consistent with β₀ = {NARRATIVES[highest_peak]['baseline_transmission']:.2f}
@@ -211,10 +278,10 @@ def main():
    - Consistent with Idw = {NARRATIVES[highest_relapse]['identity_weight']:.2f}
 
 3. Superspreaders accounted for disproportionate transmission across all narratives
-   - Attack rates: {', '.join([f"{name}: {models[name].get_profile_stratified_metrics()['superspreader']['attack_rate']:.1%}" for name in NARRATIVES.keys()])}
+   - Attack rates: {', '.join([f"{name}: {profiles[name]['superspreader']['attack_rate']:.1%}" for name in NARRATIVES.keys()])}
 
 4. Moderate profile behavior determined whether epidemics reached saturation
-   - Attack rates: {', '.join([f"{name}: {models[name].get_profile_stratified_metrics()['moderate']['attack_rate']:.1%}" for name in NARRATIVES.keys()])}
+   - Attack rates: {', '.join([f"{name}: {profiles[name]['moderate']['attack_rate']:.1%}" for name in NARRATIVES.keys()])}
     """)
     
     print(f"\n{'='*60}")
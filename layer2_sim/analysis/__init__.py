@@ -6,12 +6,14 @@ from .export import (
     export_simulation_results,
     create_baseline_comparison_table,
     format_thesis_table,
-    run_multiple_seeds
+    run_multiple_seeds,
+    batch_run
 )
 
 __all__ = [
     'export_simulation_results',
     'create_baseline_comparison_table',
     'format_thesis_table',
-    'run_multiple_seeds'
+    'run_multiple_seeds',
+    'batch_run'
 ]
\ No newline at end of file
@@ -3,17 +3,48 @@ Analysis utilities for Layer 2 SEIRS model.
 Includes data export and summary statistics.
 """
 
+import os
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
 
+# Write buffer for CSV exports (coalesces pandas' many small writes)
+CSV_BUFFER_SIZE = 1 << 20
+
+# Parquet settings for trajectory exports (requires pyarrow)
+PARQUET_COMPRESSION = 'zstd'
+PARQUET_ROW_GROUP_SIZE = 1000
+
+
+def _write_csv(df: pd.DataFrame, path: Path, index: bool = True):
+    """Write a DataFrame to CSV through a single large write buffer."""
+    with open(path, 'w', buffering=CSV_BUFFER_SIZE, newline='') as f:
+        df.to_csv(f, index=index)
+
+
+def _write_parquet(df: pd.DataFrame, path: Path):
+    """Write a DataFrame to a zstd-compressed Parquet file."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    pq.write_table(
+        pa.Table.from_pandas(df),
+        path,
+        compression=PARQUET_COMPRESSION,
+        row_group_size=PARQUET_ROW_GROUP_SIZE
+    )
+
+
 def export_simulation_results(
     model,
     output_dir: str = "results",
     narrative_name: str = "N1_conspiracies",
     include_trajectories: bool = True,
-    include_profile_metrics: bool = True
+    include_profile_metrics: bool = True,
+    trajectory_format: str = "csv"
 ) -> dict:
     """
     Export simulation results to CSV files.
@@ -24,10 +55,14 @@ def export_simulation_results(
         narrative_name: Name identifier for this narrative
         include_trajectories: Export S/E/I/R time series
         include_profile_metrics: Export profile-stratified metrics
+        trajectory_format: 'csv' or 'parquet' (requires pyarrow) for the trajectory file
     
     Returns:
         dict: Paths to created files
     """
+    if trajectory_format not in ('csv', 'parquet'):
+        raise ValueError(f"Unknown trajectory format: {trajectory_format}")
+    
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
     
@@ -54,7 +89,7 @@ def export_simulation_results(
     }])
     
     overall_file = output_path / f"{narrative_name}_overall_metrics.csv"
-    overall_df.to_csv(overall_file, index=False)
+    _write_csv(overall_df, overall_file, index=False)
     created_files['overall'] = str(overall_file)
     
     # 2. Profile-stratified metrics
@@ -78,7 +113,7 @@ def export_simulation_results(
         
         profile_df = pd.DataFrame(profile_rows)
         profile_file = output_path / f"{narrative_name}_profile_metrics.csv"
-        profile_df.to_csv(profile_file, index=False)
+        _write_csv(profile_df, profile_file, index=False)
         created_files['profiles'] = str(profile_file)
     
     # 3. State trajectories
@@ -86,8 +121,11 @@ def export_simulation_results(
         traj_df = model.datacollector.get_model_vars_dataframe()
         traj_df['narrative'] = narrative_name
         
-        traj_file = output_path / f"{narrative_name}_trajectories.csv"
-        traj_df.to_csv(traj_file)
+        traj_file = output_path / f"{narrative_name}_trajectories.{trajectory_format}"
+        if trajectory_format == 'parquet':
+            _write_parquet(traj_df, traj_file)
+        else:
+            _write_csv(traj_df, traj_file)
         created_files['trajectories'] = str(traj_file)
     
     return created_files
@@ -101,7 +139,8 @@ def create_baseline_comparison_table(
     Create comparison table across multiple narratives.
     
     Args:
-        results: Dict mapping narrative names to model instances
+        results: Dict mapping narrative names to model instances (or run
+                 summaries exposing the same metric methods)
                  e.g., {'N1': model1, 'N2': model2, 'N3': model3}
         output_file: Path to save CSV
     
@@ -116,7 +155,7 @@ def create_baseline_comparison_table(
         
         # Calculate relapse rate
         total_infections = model.cumulative_infected
-        total_relapses = sum(a.relapse_count for a in model.agents)
+        total_relapses = model.total_relapses
         relapse_rate = total_relapses / total_infections if total_infections > 0 else 0.0
         
         rows.append({
@@ -131,7 +170,7 @@ def create_baseline_comparison_table(
     df = pd.DataFrame(rows)
     
     if output_file:
-        df.to_csv(output_file, index=False)
+        _write_csv(df, Path(output_file), index=False)
         print(f"Saved comparison table to {output_file}")
     
     return df
@@ -145,7 +184,8 @@ def format_thesis_table(
     Generate LaTeX-formatted table for thesis.
     
     Args:
-        model: DisinformationModel instance
+        model: DisinformationModel instance (or run summary exposing
+               get_profile_stratified_metrics)
         narrative_name: Narrative identifier
     
     Returns:
@@ -153,6 +193,14 @@ def format_thesis_table(
     """
     profile_data = model.get_profile_stratified_metrics()
     
+    rows = "".join(
+        f"{archetype.replace('_', ' ').title()} & "
+        f"{data['attack_rate']:.1%} & "
+        f"{data['mean_time_in_I']:.1f} & "
+        f"{data['correction_rate']:.1%} \\\\\n"
+        for archetype, data in profile_data.items()
+    )
+    
     latex = f"""
 \\begin{{table}}[h]
 \\centering
@@ -161,21 +209,99 @@ def format_thesis_table(
 \\toprule
 Profile & Attack Rate & Mean Time in I & Correction Rate \\\\
 \\midrule
+{rows}\\bottomrule
+\\end{{tabular}}
+\\end{{table}}
 """
     
-    for archetype, data in profile_data.items():
-        display_name = archetype.replace('_', ' ').title()
-        latex += f"{display_name} & "
-        latex += f"{data['attack_rate']:.1%} & "
-        latex += f"{data['mean_time_in_I']:.1f} & "
-        latex += f"{data['correction_rate']:.1%} \\\\\n"
+    return latex
+
+
+def _init_worker():
+    """
+    Limit a worker process to one Numba thread.
     
-    latex += """\\bottomrule
-\\end{tabular}
-\\end{table}
-"""
+    Workers already run one simulation per core, so letting each parallel
+    kernel spawn a thread per core as well would oversubscribe the CPU.
+    """
+    try:
+        from ..model.kernels import NUMBA_AVAILABLE
+    except ImportError:  # analysis imported as a top-level package
+        from model.kernels import NUMBA_AVAILABLE
     
-    return latex
+    if NUMBA_AVAILABLE:
+        import numba
+        numba.set_num_threads(1)
+
+
+def _run_model(params: dict) -> tuple:
+    """
+    Build and run one simulation from DisinformationModel keyword arguments.
+    
+    Args:
+        params: DisinformationModel keyword arguments plus an optional
+                'max_steps' (default 100)
+    
+    Returns:
+        tuple: (finished model, dict of summary results)
+    """
+    try:
+        from ..model.model import DisinformationModel
+    except ImportError:  # analysis imported as a top-level package
+        from model.model import DisinformationModel
+    
+    model_params = dict(params)
+    max_steps = model_params.pop('max_steps', 100)
+    
+    model = DisinformationModel(**model_params)
+    model.run(max_steps=max_steps)
+    
+    metrics = model.get_peak_metrics()
+    R0, _ = model.calculate_R0()
+    
+    row = {
+        'seed': model_params.get('seed'),
+        'R0': R0,
+        'peak_infected': metrics['max_infected'],
+        'peak_infected_pct': metrics['max_infected_pct'],
+        'time_to_peak': metrics['time_to_peak'],
+        'attack_rate': metrics['attack_rate']
+    }
+    return model, row
+
+
+def _run_one_seed(
+    seed: int,
+    narrative_params: dict,
+    archetype_dist: dict,
+    population: int,
+    max_steps: int,
+    kwargs: dict,
+    include_trajectory: bool = False
+):
+    """
+    Run one seeded simulation and summarize it (worker for run_multiple_seeds).
+    
+    Returns:
+        dict: Row of results for this seed, or (row, trajectory DataFrame)
+              if include_trajectory
+    """
+    model, row = _run_model(dict(
+        narrative_params=narrative_params,
+        archetype_dist=archetype_dist,
+        population=population,
+        seed=seed,
+        max_steps=max_steps,
+        **kwargs
+    ))
+    
+    if not include_trajectory:
+        return row
+    
+    traj_df = model.datacollector.get_model_vars_dataframe()
+    traj_df.insert(0, 'step', traj_df.index)
+    traj_df.insert(0, 'seed', seed)
+    return row, traj_df
 
 
 def run_multiple_seeds(
@@ -184,48 +310,50 @@ def run_multiple_seeds(
     seeds: list,
     population: int = 1000,
     max_steps: int = 100,
+    max_workers: Optional[int] = None,
+    trajectory_file: Optional[str] = None,
     **kwargs
 ) -> pd.DataFrame:
     """
     Run simulation with multiple random seeds for statistical analysis.
     
+    Seeds are independent, so runs are spread over worker processes (each
+    limited to one Numba thread).
+    
     Args:
         narrative_params: Narrative configuration
         archetype_dist: Archetype distribution
         seeds: List of random seeds to use
         population: Population size
         max_steps: Maximum simulation steps
+        max_workers: Number of worker processes (default: CPU count)
+        trajectory_file: If given, stream every seed's S/E/I/R trajectory to
+                         this Parquet file (requires pyarrow) as runs finish
         **kwargs: Additional model parameters
     
     Returns:
         DataFrame with results from all runs
     """
-    from model.model import DisinformationModel
-    
-    results = []
+    workers = max_workers or os.cpu_count() or 1
+    worker = partial(
+        _run_one_seed,
+        narrative_params=narrative_params,
+        archetype_dist=archetype_dist,
+        population=population,
+        max_steps=max_steps,
+        kwargs=kwargs,
+        include_trajectory=trajectory_file is not None
+    )
     
-    for seed in seeds:
-        model = DisinformationModel(
-            narrative_params=narrative_params,
-            archetype_dist=archetype_dist,
-            population=population,
-            seed=seed,
-            **kwargs
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        outputs = executor.map(
+            worker, seeds, chunksize=max(1, len(seeds) // (4 * workers))
         )
         
-        model.run(max_steps=max_steps)
-        
-        metrics = model.get_peak_metrics()
-        R0, _ = model.calculate_R0()
-        
-        results.append({
-            'seed': seed,
-            'R0': R0,
-            'peak_infected': metrics['max_infected'],
-            'peak_infected_pct': metrics['max_infected_pct'],
-            'time_to_peak': metrics['time_to_peak'],
-            'attack_rate': metrics['attack_rate']
-        })
+        if trajectory_file is None:
+            results = list(outputs)
+        else:
+            results = _stream_trajectories(outputs, Path(trajectory_file))
     
     df = pd.DataFrame(results)
     
@@ -233,4 +361,76 @@ def run_multiple_seeds(
     print("\n=== Summary Statistics (n={}) ===".format(len(seeds)))
     print(df.describe())
     
-    return df
\ No newline at end of file
+    return df
+
+
+def _run_batch_item(params: dict) -> dict:
+    """
+    Run one simulation from a parameter dict (worker for batch_run).
+    
+    Returns:
+        dict: Row of results for this run
+    """
+    model, row = _run_model(params)
+    row['total_relapses'] = model.total_relapses
+    row['total_steps'] = model.current_step
+    return row
+
+
+def batch_run(
+    params_list: list,
+    max_workers: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Run independent simulations in parallel (e.g. a parameter sweep).
+    
+    Args:
+        params_list: One dict per run with DisinformationModel keyword
+                     arguments (narrative_params, archetype_dist, seed, ...)
+                     plus an optional 'max_steps' (default 100)
+        max_workers: Number of worker processes (default: CPU count)
+    
+    Returns:
+        DataFrame with one row per run, in the order of params_list
+    """
+    workers = max_workers or os.cpu_count() or 1
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        results = list(executor.map(
+            _run_batch_item, params_list,
+            chunksize=max(1, len(params_list) // (4 * workers))
+        ))
+    
+    df = pd.DataFrame(results)
+    df.index.name = 'run'
+    return df
+
+
+def _stream_trajectories(outputs, path: Path) -> list:
+    """
+    Append each run's trajectory to one Parquet file as runs complete.
+    
+    Args:
+        outputs: Iterable of (row, trajectory DataFrame) from _run_one_seed
+        path: Parquet file to write
+    
+    Returns:
+        list: Result rows in input order
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    results = []
+    writer = None
+    try:
+        for row, traj_df in outputs:
+            table = pa.Table.from_pandas(traj_df, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema, compression=PARQUET_COMPRESSION)
+            writer.write_table(table, row_group_size=PARQUET_ROW_GROUP_SIZE)
+            results.append(row)
+    finally:
+        if writer is not None:
+            writer.close()
+    
+    return results
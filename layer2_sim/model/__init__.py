@@ -5,19 +5,28 @@ Core components:
 - DisinformationAgent: Agents with psychographic traits
 - DisinformationModel: Network-based epidemic model
 - Narrative: Disinformation narrative parameters
+- PopulationArrays: Struct-of-arrays agent state and traits
 - ARCHETYPES: Five psychographic profiles
 """
 
 from .agent import DisinformationAgent
 from .model import DisinformationModel
 from .narrative import Narrative
-from .archetypes import ARCHETYPES, STATE_COLORS, STATE_LABELS
+from .population import PopulationArrays
+from .archetypes import (
+    ARCHETYPES, ARCHETYPE_COLORS, ARCHETYPE_DIST, ARCHETYPE_DISPLAY_NAMES,
+    STATE_COLORS, STATE_LABELS
+)
 
 __all__ = [
     'DisinformationAgent',
     'DisinformationModel',
     'Narrative',
+    'PopulationArrays',
     'ARCHETYPES',
+    'ARCHETYPE_COLORS',
+    'ARCHETYPE_DIST',
+    'ARCHETYPE_DISPLAY_NAMES',
     'STATE_COLORS',
     'STATE_LABELS',
 ]
\ No newline at end of file
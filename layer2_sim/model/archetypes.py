@@ -8,6 +8,10 @@ Based on:
 - Tajfel & Turner (1979): Identity Alignment
 """
 
+import math
+
+import numpy as np
+
 # Five fixed psychographic archetypes representing realistic population segments
 ARCHETYPES = {
     'immune': {
@@ -62,6 +66,27 @@ ARCHETYPES = {
     }
 }
 
+# Integer archetype codes (index into ARCHETYPE_NAMES) for array storage
+ARCHETYPE_NAMES = tuple(ARCHETYPES.keys())
+ARCHETYPE_INDEX = {name: code for code, name in enumerate(ARCHETYPE_NAMES)}
+
+# Lookup tables built once at import, so hot paths avoid nested dict lookups
+TRAIT_NAMES = ('nfc', 'trust', 'cb', 'ia')
+
+# Trait rows (TRAIT_NAMES order) x one column per archetype code, float32 like
+# the population trait arrays
+ARCHETYPE_TRAITS = np.array(
+    [[ARCHETYPES[name][trait] for name in ARCHETYPE_NAMES] for trait in TRAIT_NAMES],
+    dtype=np.float32
+)
+
+# Default population shares, in the archetype_dist form DisinformationModel expects
+ARCHETYPE_DIST = {name: ARCHETYPES[name]['distribution'] for name in ARCHETYPE_NAMES}
+
+# Human-readable archetype names and color markers for tables and UI labels
+ARCHETYPE_DISPLAY_NAMES = {name: name.replace('_', ' ').title() for name in ARCHETYPE_NAMES}
+ARCHETYPE_COLORS = {name: ARCHETYPES[name]['color'] for name in ARCHETYPE_NAMES}
+
 
 def validate_archetype_distribution(distribution: dict) -> bool:
     """
@@ -73,8 +98,9 @@ def validate_archetype_distribution(distribution: dict) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    total = sum(distribution.values())
-    return abs(total - 1.0) < 0.001  # Allow small floating point error
+    # fsum is exactly rounded, so the tolerance only has to absorb user rounding
+    total = math.fsum(distribution.values())
+    return abs(total - 1.0) < 0.001  # Allow small rounding in user input
 
 
 def get_archetype_counts(population: int, distribution: dict) -> dict:
@@ -0,0 +1,200 @@
+"""
+Lightweight per-step data collection for the SEIRS model.
+
+Replaces mesa.DataCollector, whose per-reporter lambdas each scanned the
+whole agent set every step, with vectorized counts written into a
+preallocated array.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import TYPE_CHECKING
+
+from .archetypes import ARCHETYPE_NAMES
+from .population import I
+
+if TYPE_CHECKING:
+    from .model import DisinformationModel
+
+
+# Trajectory column for infected agents of each archetype
+ARCHETYPE_COLUMNS = {
+    'immune': 'Infected_Immune',
+    'superspreader': 'Infected_Superspreader',
+    'moderate': 'Infected_Moderate',
+    'critical_thinker': 'Infected_Critical',
+    'cynical_contrarian': 'Infected_Cynical',
+}
+
+STATE_COLUMNS = ('Susceptible', 'Exposed', 'Infected', 'Recovered')
+
+COLUMNS = (
+    STATE_COLUMNS
+    + ('Cumulative_Infected',)
+    + tuple(ARCHETYPE_COLUMNS[name] for name in ARCHETYPE_NAMES)
+)
+
+# Consecutive unchanged rows after which collection is downsampled
+STEADY_STEPS = 5
+
+
+class StateCollector:
+    """
+    Records SEIRS compartment counts once per step.
+
+    Provides the parts of the mesa.DataCollector interface used in this
+    project: collect(model) and get_model_vars_dataframe(), with the same
+    column names as before.
+
+    Each call to collect() is one step. With collect_every > 1, once the
+    counts have stayed identical for steady_after collected steps only every
+    collect_every-th step is counted and recorded, until a recorded row
+    differs again. Rows are labelled with their step, so the DataFrame index
+    has gaps where steps were skipped; a peak inside a skipped stretch can be
+    missed, so peak metrics are exact only with collect_every=1.
+
+    Attributes:
+        collect_every (int): Recording interval during a steady tail
+        peak_infected (int): Largest Infected count collected so far
+        peak_step (int): Step where peak_infected was first reached
+    """
+
+    def __init__(self, capacity: int = 128, collect_every: int = 1,
+                 steady_after: int = STEADY_STEPS):
+        """
+        Args:
+            capacity: Initial number of rows to allocate (grows as needed)
+            collect_every: Record only every collect_every-th step while the
+                           counts are steady (1 = record every step)
+            steady_after: Unchanged consecutive rows before downsampling starts
+        """
+        if collect_every < 1:
+            raise ValueError(f"collect_every must be >= 1, got {collect_every}")
+
+        self._data = np.zeros((capacity, len(COLUMNS)), dtype=np.int64)
+        self._steps = np.zeros(capacity, dtype=np.int64)
+        self._n_rows = 0
+        self._step = 0  # Step number of the next collect() call
+
+        self.collect_every = collect_every
+        self._steady_after = steady_after
+        self._unchanged = 0  # Consecutive recorded rows equal to their predecessor
+
+        # Running peak of the Infected column (first step reaching the max)
+        self.peak_infected = 0
+        self.peak_step = 0
+
+    def reserve(self, n_rows: int):
+        """
+        Ensure room for at least n_rows rows without reallocating.
+
+        Args:
+            n_rows: Total number of rows expected
+        """
+        if n_rows > self._data.shape[0]:
+            data = np.zeros((n_rows, len(COLUMNS)), dtype=np.int64)
+            data[:self._n_rows] = self._data[:self._n_rows]
+            self._data = data
+            steps = np.zeros(n_rows, dtype=np.int64)
+            steps[:self._n_rows] = self._steps[:self._n_rows]
+            self._steps = steps
+
+    def collect(self, model: 'DisinformationModel'):
+        """
+        Append one row of counts for the model's current state.
+
+        During a steady tail (see class docstring) steps off the
+        collect_every grid are counted without computing anything.
+
+        Args:
+            model: DisinformationModel to record
+        """
+        step = self._step
+        self._step += 1
+        if (self.collect_every > 1 and self._unchanged >= self._steady_after
+                and step % self.collect_every):
+            return
+
+        if self._n_rows == self._data.shape[0]:
+            self.reserve(2 * self._n_rows)
+
+        # One pass: joint (state, archetype) histogram, shape (4, n_archetypes)
+        pop = model.arrays
+        n_archetypes = len(ARCHETYPE_NAMES)
+        joint = np.bincount(
+            pop.state * n_archetypes + pop.archetype_code, minlength=4 * n_archetypes
+        ).reshape(4, n_archetypes)
+
+        row = self._data[self._n_rows]
+        row[0:4] = joint.sum(axis=1)
+        row[4] = model.cumulative_infected
+        row[5:] = joint[I]
+        self._steps[self._n_rows] = step
+
+        if self._n_rows == 0 or row[2] > self.peak_infected:
+            self.peak_infected = int(row[2])
+            self.peak_step = step
+
+        if self._n_rows > 0 and np.array_equal(row, self._data[self._n_rows - 1]):
+            self._unchanged += 1
+        else:
+            self._unchanged = 0
+        self._n_rows += 1
+
+    def pad(self, last_step: int):
+        """
+        Repeat the last collected row for every step up to last_step.
+
+        Only meaningful when the model has reached an absorbing state, so
+        the skipped steps would have recorded identical counts.
+
+        Args:
+            last_step: Final step to record (inclusive)
+        """
+        if self._n_rows == 0 or last_step < self._step:
+            return
+        n_rows = self._n_rows + last_step + 1 - self._step
+        self.reserve(n_rows)
+        self._data[self._n_rows:n_rows] = self._data[self._n_rows - 1]
+        self._steps[self._n_rows:n_rows] = np.arange(self._step, last_step + 1)
+        self._n_rows = n_rows
+        self._step = last_step + 1
+
+    @property
+    def n_rows(self) -> int:
+        """Number of rows collected so far."""
+        return self._n_rows
+
+    @property
+    def steps(self) -> np.ndarray:
+        """Step of each collected row (read-only view)."""
+        steps = self._steps[:self._n_rows]
+        steps.flags.writeable = False
+        return steps
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Get one collected column as an array, without building a DataFrame.
+
+        Args:
+            name: Column name from COLUMNS
+
+        Returns:
+            Read-only view of the column (one entry per collected step)
+        """
+        values = self._data[:self._n_rows, COLUMNS.index(name)]
+        values.flags.writeable = False
+        return values
+
+    def get_model_vars_dataframe(self) -> pd.DataFrame:
+        """
+        Get collected data as a DataFrame indexed by step.
+
+        Returns:
+            DataFrame with one row per collected step
+        """
+        if self._n_rows == self._step:
+            index = None  # No skipped steps: row number is the step
+        else:
+            index = pd.Index(self._steps[:self._n_rows])
+        return pd.DataFrame(self._data[:self._n_rows], index=index, columns=list(COLUMNS))
@@ -0,0 +1,109 @@
+"""
+Compiled SEIRS transition kernel.
+
+Fuses exposure, adoption, correction and relapse into a single pass over the
+population arrays. Numba is optional: when it is not installed the model
+falls back to the vectorized NumPy transitions in DisinformationModel.step().
+
+Transition probabilities are precomputed per agent by the model (see
+transitions.py), so the kernel only compares draws against them.
+
+Setting the environment variable LAYER2_NO_JIT=1 makes models default to the
+NumPy path even when Numba is installed, which avoids the one-off compile for
+short runs and gives a reference implementation to check the kernel against.
+"""
+
+import math
+import os
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    NUMBA_AVAILABLE = False
+
+# Finite stand-in for log(1 - α) = -inf at α = 1 (exp(-745) rounds to 0 in float64)
+LOG1M_ALPHA_MIN = -745.0
+
+# LAYER2_NO_JIT=1: models default to the NumPy path (an explicit use_jit=True still applies)
+JIT_DISABLED = os.environ.get('LAYER2_NO_JIT') == '1'
+
+
+def _step_kernel(state, log1m_alpha, sigma, gamma, omega, indptr, indices, u, out_state,
+                 infection_count, recovery_count, relapse_count,
+                 time_in_I, current_I_duration):
+    """
+    Compute next states for all agents and update history counters.
+
+    Each agent's current state is read once, only the transition it allows
+    is tested, and the counters that DisinformationModel._advance() would
+    update are written in the same pass. Infected neighbors are counted by
+    walking the CSR row, and only for susceptible agents.
+
+    Args:
+        state: Current states (int8, 0=S, 1=E, 2=I, 3=R)
+        log1m_alpha: Per-agent log(1 - α), floored at LOG1M_ALPHA_MIN (finite, as
+                     fastmath assumes)
+        sigma, gamma, omega: Per-agent transition probabilities
+        indptr, indices: CSR adjacency (neighbors of i are indices[indptr[i]:indptr[i+1]])
+        u: One uniform draw per agent in [0, 1)
+        out_state: Output array for next states (same shape as state)
+        infection_count, recovery_count, relapse_count, time_in_I,
+        current_I_duration: Per-agent counters, updated in place
+
+    Returns:
+        Number of agents that entered I this step
+    """
+    new_infections = 0
+    for i in prange(state.shape[0]):
+        s = state[i]
+        out_state[i] = s
+
+        if s == 0:
+            # S → E: P(exposed) = 1 - (1 - α)^k = -expm1(k·log(1 - α))
+            # Branch-free count so LLVM can vectorize the row scan
+            k = 0
+            for j in range(indptr[i], indptr[i + 1]):
+                k += state[indices[j]] == 2
+            if k > 0:
+                p = -math.expm1(k * log1m_alpha[i])
+                if u[i] < p:
+                    out_state[i] = 1
+
+        elif s == 1:
+            # E → I: entering I state
+            if u[i] < sigma[i]:
+                out_state[i] = 2
+                new_infections += 1
+                infection_count[i] += 1
+                time_in_I[i] += 1
+                current_I_duration[i] = 1
+
+        elif s == 2:
+            # I → R: successful correction
+            if u[i] < gamma[i]:
+                out_state[i] = 3
+                recovery_count[i] += 1
+            else:
+                time_in_I[i] += 1
+                current_I_duration[i] += 1
+
+        else:
+            # R → S: relapse
+            if u[i] < omega[i]:
+                out_state[i] = 0
+                relapse_count[i] += 1
+
+    return new_infections
+
+
+# Numba's on-disk cache re-imports the module a kernel was compiled in, by
+# name, when loading it, so only cache under the package's import name
+# (layer2_sim.model.kernels); a cache written under another name fails to
+# load in processes where that name is not importable
+CACHE_KERNEL = __name__ == 'layer2_sim.model.kernels'
+
+if NUMBA_AVAILABLE:
+    step_kernel = njit(parallel=True, fastmath=True, cache=CACHE_KERNEL)(_step_kernel)
+else:
+    step_kernel = None
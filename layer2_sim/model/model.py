@@ -10,14 +10,23 @@ Implements:
 """
 
 import mesa
-from mesa import Model, DataCollector
+from mesa import Model
 import networkx as nx
 import numpy as np
+from scipy import sparse
 from typing import Optional
 
 from .agent import DisinformationAgent
 from .narrative import Narrative
-from .archetypes import ARCHETYPES, get_archetype_counts, validate_archetype_distribution
+from .population import PopulationArrays, STATE_CODES, S, E, I, R
+from .collector import StateCollector
+from .transitions import calculate_alpha, calculate_sigma, calculate_gamma, calculate_omega
+from .kernels import NUMBA_AVAILABLE, JIT_DISABLED, LOG1M_ALPHA_MIN, step_kernel
+from .network import barabasi_albert_csr
+from .archetypes import (
+    ARCHETYPE_NAMES, ARCHETYPE_INDEX, ARCHETYPE_TRAITS, TRAIT_NAMES,
+    get_archetype_counts, validate_archetype_distribution
+)
 
 
 class DisinformationModel(Model):
@@ -27,10 +36,17 @@ class DisinformationModel(Model):
     Attributes:
         narrative: Narrative parameters (β₀, Emo, Idw, p₀)
         population: Number of agents
-        G: NetworkX scale-free graph
-        schedule: SimultaneousActivation scheduler
-        datacollector: Mesa DataCollector for metrics
-        cumulative_infected: Total ever infected (for attack rate)
+        G: NetworkX view of the network (built on first access)
+        adjacency: SciPy CSR adjacency matrix of the network (int32 entries)
+        indptr, indices: CSR arrays of adjacency (neighbors of i are indices[indptr[i]:indptr[i+1]])
+        degrees, mean_degree: Node degrees (int32) and their mean
+        arrays: PopulationArrays holding per-agent state, traits and counters
+        agents: DisinformationAgent views onto arrays (created on first access)
+        alpha_per_agent, sigma_per_agent, gamma_per_agent, omega_per_agent:
+            Precomputed per-agent transition probabilities
+        datacollector: StateCollector with per-step SEIRS counts
+        cumulative_infected: Infection events so far (seeds + every E → I entry, so
+            re-infections count again); kept as a running O(1) counter
     """
     
     def __init__(
@@ -43,7 +59,9 @@ class DisinformationModel(Model):
         sigma_base: float = 0.30,
         gamma_base: float = 0.05,
         omega_base: float = 0.02,
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        use_jit: Optional[bool] = None,
+        collect_every: int = 1
     ):
         """
         Initialize the disinformation spread model.
@@ -59,6 +77,10 @@ class DisinformationModel(Model):
             gamma_base: Base correction rate (I→R)
             omega_base: Base relapse rate (R→S)
             seed: Random seed for reproducibility
+            use_jit: Use the Numba transition kernel (None = use it if Numba is installed
+                     and LAYER2_NO_JIT=1 is not set)
+            collect_every: Once the counts stop changing, record only every
+                           collect_every-th step (1 = record every step; see StateCollector)
         """
         super().__init__(seed=seed)
         
@@ -74,22 +96,55 @@ class DisinformationModel(Model):
         self.population = population
         self.m_edges = m_edges
         self.seeding_strategy = seeding_strategy
+        self.archetype_dist = dict(archetype_dist)
         
         # Base transition rates
         self.sigma_base = sigma_base
         self.gamma_base = gamma_base
         self.omega_base = omega_base
         
+        # Transition backend
+        if use_jit is None:
+            use_jit = NUMBA_AVAILABLE and not JIT_DISABLED
+        elif use_jit and not NUMBA_AVAILABLE:
+            raise ImportError("use_jit=True requires numba to be installed")
+        self.use_jit = use_jit
+        self.collect_every = collect_every
+        
         # Metrics tracking
         self.cumulative_infected = 0
         self.current_step = 0
+        self._profile_metrics_cache = None  # (step, metrics)
+        
+        # Create network; all simulation code uses the CSR arrays
+        self.adjacency = self._create_network()
+        self.indptr, self.indices = self.adjacency.indptr, self.adjacency.indices
+        self._G = None
         
-        # Create network
-        self.G = self._create_network()
+        # The network is static, so degree statistics are computed once
+        self.degrees = np.diff(self.indptr)
+        self.mean_degree = float(self.degrees.mean())
         
         # Create agents (Mesa 3.x manages agents internally)
+        # Agents are views onto these arrays, so allocate them first
+        self.arrays = PopulationArrays.allocate(self.population)
         self._create_agents(archetype_dist)
         
+        # Agent ids of each archetype, for seeding
+        self._by_archetype = {
+            name: np.flatnonzero(self.arrays.archetype_code == code)
+            for code, name in enumerate(ARCHETYPE_NAMES)
+        }
+        
+        # Per-agent transition probabilities and R₀, recomputed only if an
+        # agent's traits or archetype are changed (see _refresh_rates)
+        self._refresh_rates()
+        
+        # Reused per-step buffers: uniform draws from self.rng (PCG64) and the
+        # next-state array, which is swapped with arrays.state after each step
+        self._u = np.empty(self.population, dtype=np.float32)
+        self._next_state = np.empty_like(self.arrays.state)
+        
         # Initial seeding
         self._seed_initial_infections()
         
@@ -101,14 +156,24 @@ class DisinformationModel(Model):
     # INITIALIZATION METHODS
     # ============================================================================
     
-    def _create_network(self) -> nx.Graph:
+    def _create_network(self) -> sparse.csr_array:
         """
         Create scale-free network using Barabási-Albert model.
         
+        Generated directly as a CSR adjacency; the edges are identical to
+        nx.barabasi_albert_graph with the same seed.
+        
         Returns:
-            NetworkX graph
+            CSR array with int32 entries and int32 indptr/indices
         """
-        return nx.barabasi_albert_graph(n=self.population, m=self.m_edges, seed=self.seed_value)
+        return barabasi_albert_csr(n=self.population, m=self.m_edges, seed=self.seed_value)
+    
+    @property
+    def G(self) -> nx.Graph:
+        """NetworkX graph of the network, built from the CSR adjacency on first access."""
+        if self._G is None:
+            self._G = nx.from_scipy_sparse_array(self.adjacency)
+        return self._G
     
     def _create_agents(self, archetype_dist: dict):
         """
@@ -119,23 +184,108 @@ class DisinformationModel(Model):
         """
         # Calculate counts for each archetype
         archetype_counts = get_archetype_counts(self.population, archetype_dist)
+        names = list(archetype_counts)
+        counts = list(archetype_counts.values())
+        
+        # Fill archetype codes and traits in contiguous blocks, one per archetype
+        pop = self.arrays
+        codes = [ARCHETYPE_INDEX[name] for name in names]
+        pop.archetype_code[:] = np.repeat(codes, counts)
+        for field, values in zip(TRAIT_NAMES, ARCHETYPE_TRAITS):
+            getattr(pop, field)[:] = np.repeat(values[codes], counts)
+        
+        # Agent objects are views onto these rows; nothing in a run needs
+        # them, so they are only created on first access (see agents)
+        self._agent_views_created = False
+    
+    def _create_agent_views(self):
+        """Create one DisinformationAgent view per population row, once."""
+        if self._agent_views_created:
+            return
+        self._agent_views_created = True
+        for agent_id in range(self.population):
+            DisinformationAgent(model=self, unique_id=agent_id)
+            # Mesa 3.x auto-registers agents
+    
+    @property
+    def agents(self) -> mesa.agent.AgentSet:
+        """AgentSet of all agents, creating the agent views on first access."""
+        self._create_agent_views()
+        return super().agents
+    
+    @property
+    def agents_by_type(self) -> dict:
+        """AgentSets keyed by agent type, creating the agent views on first access."""
+        self._create_agent_views()
+        return super().agents_by_type
+    
+    @property
+    def agent_types(self) -> list:
+        """Agent types in the model, creating the agent views on first access."""
+        self._create_agent_views()
+        return super().agent_types
+    
+    def _refresh_rates(self):
+        """
+        Recompute per-agent transition rates and R₀ from the current traits.
         
-        agent_id = 0
-        for archetype_name, count in archetype_counts.items():
-            archetype_params = ARCHETYPES[archetype_name]
-            
-            for _ in range(count):
-                agent = DisinformationAgent(
-                    model=self,
-                    unique_id=agent_id,
-                    archetype=archetype_name,
-                    need_for_cognition=archetype_params['nfc'],
-                    institutional_trust=archetype_params['trust'],
-                    confirmation_bias=archetype_params['cb'],
-                    identity_alignment=archetype_params['ia']
-                )
-                # Mesa 3.x auto-registers agents
-                agent_id += 1
+        Called at construction and, when an agent's traits or archetype have
+        been changed through its setters (which set _rates_stale), before the
+        next step or R₀ query.
+        """
+        self._compute_transition_rates()
+        self._r0_cache = self._compute_R0()
+        self._rates_stale = False
+    
+    def _compute_transition_rates(self):
+        """
+        Evaluate α, σ, γ, ω once for every agent.
+        
+        These depend only on agent traits, the narrative and the base rates,
+        so steps only compare draws against the cached arrays.
+        
+        While every agent holds its archetype's trait values (as set by
+        _create_agents), the formulas are evaluated once per archetype and
+        broadcast to agents by archetype code. Otherwise they are evaluated on
+        the per-agent trait arrays and _archetype_rates is None.
+        """
+        pop = self.arrays
+        codes = pop.archetype_code
+        
+        per_archetype = all(
+            np.array_equal(getattr(pop, field), values[codes])
+            for field, values in zip(TRAIT_NAMES, ARCHETYPE_TRAITS)
+        )
+        if per_archetype:
+            # Trait rows (nfc, trust, cb, ia) x one column per archetype code
+            traits = (*ARCHETYPE_TRAITS, self.narrative)
+        else:
+            traits = (*(getattr(pop, field) for field in TRAIT_NAMES), self.narrative)
+        
+        # Rows α, σ, γ, ω x one column per archetype code (or per agent); keep
+        # float32 like the traits, even if a parameter arrives as float64
+        rates = np.stack([
+            calculate_alpha(*traits),
+            calculate_sigma(*traits, self.sigma_base),
+            calculate_gamma(*traits, self.gamma_base),
+            calculate_omega(*traits, self.omega_base),
+        ]).astype(np.float32, copy=False)
+        
+        if per_archetype:
+            self._archetype_rates = rates
+            (self.alpha_per_agent, self.sigma_per_agent,
+             self.gamma_per_agent, self.omega_per_agent) = (row[codes] for row in rates)
+        else:
+            self._archetype_rates = None
+            (self.alpha_per_agent, self.sigma_per_agent,
+             self.gamma_per_agent, self.omega_per_agent) = rates
+        
+        # log(1 - α) for the exposure probability -expm1(k·log(1 - α)). Floored at
+        # LOG1M_ALPHA_MIN instead of -inf where α = 1: the kernel is compiled with
+        # fastmath, which assumes no infinities. expm1 of anything at or below the
+        # floor is exactly -1 in float64, so exposure stays certain.
+        with np.errstate(divide='ignore'):
+            self._log1m_alpha = np.maximum(np.log1p(-self.alpha_per_agent), LOG1M_ALPHA_MIN)
     
     def _seed_initial_infections(self):
         """
@@ -146,60 +296,47 @@ class DisinformationModel(Model):
         if n_seed == 0:
             n_seed = 1  # Ensure at least one seed
         
-        agent_list = list(self.agents)
-        
         if self.seeding_strategy == 'random':
-            seed_agents = self.random.sample(agent_list, n_seed)
+            seed_ids = self.rng.choice(self.population, size=n_seed, replace=False)
         
         elif self.seeding_strategy == 'hub_targeted':
-            # Seed high-degree nodes
-            degrees = dict(self.G.degree())
-            sorted_nodes = sorted(degrees.items(), key=lambda x: x[1], reverse=True)
-            seed_ids = [node_id for node_id, _ in sorted_nodes[:n_seed]]
-            seed_agents = [a for a in agent_list if a.unique_id in seed_ids]
+            # Seed the n_seed highest-degree nodes (ties go to lower ids)
+            degrees = self.degrees
+            cutoff = degrees[np.argpartition(-degrees, n_seed - 1)[n_seed - 1]]
+            above = np.flatnonzero(degrees > cutoff)
+            tied = np.flatnonzero(degrees == cutoff)[:n_seed - len(above)]
+            seed_ids = np.concatenate([above, tied])
         
         elif self.seeding_strategy == 'archetype_proportional':
-            # Seed according to archetype distribution
-            seed_agents = []
-            for archetype_name, proportion in ARCHETYPES.items():
-                archetype_agents = [a for a in agent_list if a.archetype == archetype_name]
-                n_archetype_seed = int(n_seed * ARCHETYPES[archetype_name]['distribution'])
-                if n_archetype_seed > 0 and archetype_agents:
-                    seeds = self.random.sample(archetype_agents, min(n_archetype_seed, len(archetype_agents)))
-                    seed_agents.extend(seeds)
+            # Seed according to the configured archetype distribution
+            seed_ids = []
+            for archetype_name, proportion in self.archetype_dist.items():
+                archetype_ids = self._by_archetype[archetype_name]
+                n_archetype_seed = int(n_seed * proportion)
+                if n_archetype_seed > 0 and len(archetype_ids) > 0:
+                    seeds = self.rng.choice(archetype_ids, size=min(n_archetype_seed, len(archetype_ids)), replace=False)
+                    seed_ids.extend(seeds)
         
         else:
             raise ValueError(f"Unknown seeding strategy: {self.seeding_strategy}")
         
         # Set initial infections
-        for agent in seed_agents:
-            agent.state = 'I'
-            self.cumulative_infected += 1
+        seed_ids = np.asarray(seed_ids, dtype=np.int64)
+        self.arrays.state[seed_ids] = I
+        self.cumulative_infected += len(seed_ids)
     
-    def _setup_datacollector(self) -> DataCollector:
+    def _setup_datacollector(self) -> StateCollector:
         """
         Setup data collector for tracking metrics.
         
+        Records state counts, cumulative infections and infected counts per
+        archetype (see collector.COLUMNS) with vectorized counts over
+        self.arrays.
+        
         Returns:
-            Configured DataCollector
-        """
-        return DataCollector(
-            model_reporters={
-                # State counts
-                "Susceptible": lambda m: self._count_state(m, 'S'),
-                "Exposed": lambda m: self._count_state(m, 'E'),
-                "Infected": lambda m: self._count_state(m, 'I'),
-                "Recovered": lambda m: self._count_state(m, 'R'),
-                "Cumulative_Infected": lambda m: m.cumulative_infected,
-                
-                # Archetype-specific infected counts
-                "Infected_Immune": lambda m: self._count_infected_archetype(m, 'immune'),
-                "Infected_Superspreader": lambda m: self._count_infected_archetype(m, 'superspreader'),
-                "Infected_Moderate": lambda m: self._count_infected_archetype(m, 'moderate'),
-                "Infected_Critical": lambda m: self._count_infected_archetype(m, 'critical_thinker'),
-                "Infected_Cynical": lambda m: self._count_infected_archetype(m, 'cynical_contrarian'),
-            }
-        )
+            Configured StateCollector
+        """
+        return StateCollector(collect_every=self.collect_every)
     
     # ============================================================================
     # SIMULATION METHODS
@@ -208,32 +345,122 @@ class DisinformationModel(Model):
     def step(self):
         """
         Run one timestep of the simulation with simultaneous activation.
-        All agents calculate next state, then all advance simultaneously.
+        Next states are computed for the whole population from the current
+        states, then committed at once.
         """
-        # Step 1: All agents calculate their next state
-        for agent in self.agents:
-            agent.step()
-        
-        # Step 2: All agents advance to next state simultaneously
-        for agent in self.agents:
-            agent.advance()
+        if self._rates_stale:
+            self._refresh_rates()
+        
+        pop = self.arrays
+        
+        # One uniform draw per agent covers whichever transition its state allows
+        u = self.rng.random(dtype=np.float32, out=self._u)
+        
+        if self.use_jit:
+            # Fused kernel: neighbor counts, transitions and history counters in one pass
+            next_state = self._next_state
+            self.cumulative_infected += step_kernel(
+                pop.state,
+                self._log1m_alpha, self.sigma_per_agent,
+                self.gamma_per_agent, self.omega_per_agent,
+                self.indptr, self.indices, u, next_state,
+                pop.infection_count, pop.recovery_count, pop.relapse_count,
+                pop.time_in_I, pop.current_I_duration
+            )
+            self._next_state, pop.state = pop.state, next_state
+        else:
+            k_inf = self._count_infected_neighbors()
+            self._advance(self._next_state_numpy(k_inf, u))
         
         # Collect data
         self.datacollector.collect(self)
         self.current_step += 1
     
-    def run(self, max_steps: int = 100):
+    def _next_state_numpy(self, k_inf: np.ndarray, u: np.ndarray) -> np.ndarray:
+        """
+        Compute next states with vectorized NumPy transitions.
+        
+        Args:
+            k_inf: Infected-neighbor count per agent
+            u: One uniform draw per agent
+            
+        Returns:
+            Next state array (the model's reused next-state buffer)
+        """
+        state = self.arrays.state
+        next_state = self._next_state
+        np.copyto(next_state, state)
+        
+        # S → E: exposure through infected neighbors
+        # P(exposed) = 1 - (1 - α)^k = -expm1(k·log(1 - α)) where k = number of infected neighbors
+        # Only agents with k > 0 can be exposed
+        at_risk = np.flatnonzero((state == S) & (k_inf > 0))
+        p_exposure = -np.expm1(k_inf[at_risk] * self._log1m_alpha[at_risk])
+        next_state[at_risk[u[at_risk] < p_exposure]] = E
+        
+        # E → I: adoption through cognitive processing
+        next_state[(state == E) & (u < self.sigma_per_agent)] = I
+        
+        # I → R: correction through fact-checking or analytical reconsideration
+        next_state[(state == I) & (u < self.gamma_per_agent)] = R
+        
+        # R → S: relapse due to waning immunity
+        next_state[(state == R) & (u < self.omega_per_agent)] = S
+        
+        return next_state
+    
+    def _advance(self, next_state: np.ndarray):
+        """
+        Commit state transitions and track history for all agents.
+        
+        Args:
+            next_state: State array computed by step()
+        """
+        pop = self.arrays
+        old_state = pop.state
+        
+        # Track transitions for metrics
+        entered_I = (old_state != I) & (next_state == I)
+        self.cumulative_infected += int(entered_I.sum())
+        pop.infection_count[entered_I] += 1
+        pop.current_I_duration[entered_I] = 0
+        
+        # I → R: Successful correction
+        pop.recovery_count[(old_state == I) & (next_state == R)] += 1
+        
+        # R → S: Relapse
+        pop.relapse_count[(old_state == R) & (next_state == S)] += 1
+        
+        # Track time in I
+        in_I = next_state == I
+        pop.time_in_I[in_I] += 1
+        pop.current_I_duration[in_I] += 1
+        
+        # Swap buffers: the old state array is overwritten next step
+        self._next_state, pop.state = old_state, next_state
+    
+    def run(self, max_steps: int = 100, pad_trajectory: bool = False):
         """
         Run simulation for specified number of steps.
         
+        Stops early once no agents are exposed or infected, since no new
+        exposure can happen after that.
+        
         Args:
             max_steps: Maximum timesteps to simulate
+            pad_trajectory: If stopping early in an absorbing state, fill the
+                            remaining rows of the trajectory with the final counts
+                            so it always covers max_steps steps
         """
+        last_step = self.current_step + max_steps
+        self.datacollector.reserve(self.datacollector.n_rows + max_steps)
         for _ in range(max_steps):
             self.step()
             
             # Early stopping if epidemic ends
             if self._epidemic_ended():
+                if pad_trajectory and self._is_absorbing():
+                    self.datacollector.pad(last_step)
                 break
     
     def _epidemic_ended(self) -> bool:
@@ -243,8 +470,22 @@ class DisinformationModel(Model):
         Returns:
             True if ended, False otherwise
         """
-        return (self._count_state(self, 'E') == 0 and 
-                self._count_state(self, 'I') == 0)
+        state = self.arrays.state
+        return not np.any((state == E) | (state == I))
+    
+    def _is_absorbing(self) -> bool:
+        """
+        Check if no further state changes are possible.
+        
+        Assumes the epidemic has ended (no E or I agents). Recovered agents
+        can still relapse to S, which changes the counts without restarting
+        the spread, so the state is only absorbing when nobody in R can relapse.
+        
+        Returns:
+            True if every future step would record the same counts
+        """
+        in_R = self.arrays.state == R
+        return not np.any(self.omega_per_agent[in_R] > 0)
     
     # ============================================================================
     # METRICS & ANALYSIS
@@ -256,22 +497,38 @@ class DisinformationModel(Model):
         
         R₀ = <α> × <σ> × <k> × (1/<γ>)
         
+        The inputs (per-agent rates, network) are fixed unless agent traits
+        are edited, so the value is computed at construction (see _compute_R0)
+        and reused until then.
+        
         Returns:
             Tuple of (R0 value, components dict)
         """
-        alphas = []
-        sigmas = []
-        gammas = []
+        if self._rates_stale:
+            self._refresh_rates()
+        return self._r0_cache
+    
+    def _compute_R0(self) -> tuple[float, dict]:
+        """
+        Compute R₀ and its components from the per-agent rates.
         
-        for agent in self.agents:
-            alphas.append(agent._calculate_alpha(self.narrative))
-            sigmas.append(agent._calculate_sigma(self.narrative))
-            gammas.append(agent._calculate_gamma(self.narrative))
+        When rates are constant within an archetype, population means are the
+        per-archetype rates weighted by archetype sizes.
         
-        mean_alpha = np.mean(alphas)
-        mean_sigma = np.mean(sigmas)
-        mean_gamma = np.mean(gammas)
-        mean_degree = np.mean([self.G.degree(n) for n in self.G.nodes()])
+        Returns:
+            Tuple of (R0 value, components dict)
+        """
+        if self._archetype_rates is not None:
+            weights = np.bincount(
+                self.arrays.archetype_code, minlength=len(ARCHETYPE_NAMES)
+            ) / self.population
+            mean_alpha, mean_sigma, mean_gamma = self._archetype_rates[:3] @ weights
+        else:
+            mean_alpha, mean_sigma, mean_gamma = (
+                float(rates.mean(dtype=np.float64))
+                for rates in (self.alpha_per_agent, self.sigma_per_agent, self.gamma_per_agent)
+            )
+        mean_degree = self.mean_degree
         
         infectious_period = 1 / mean_gamma if mean_gamma > 0 else np.inf
         
@@ -287,6 +544,11 @@ class DisinformationModel(Model):
         
         return R0, components
     
+    @property
+    def total_relapses(self) -> int:
+        """Total R → S relapses across all agents."""
+        return int(self.arrays.relapse_count.sum())
+    
     def get_peak_metrics(self) -> dict:
         """
         Calculate peak prevalence metrics from collected data.
@@ -294,11 +556,10 @@ class DisinformationModel(Model):
         Returns:
             Dict with max_infected, time_to_peak, attack_rate
         """
-        df = self.datacollector.get_model_vars_dataframe()
-        
-        max_infected = df['Infected'].max()
-        time_to_peak = df['Infected'].idxmax()
-        attack_rate = df['Cumulative_Infected'].iloc[-1] / self.population
+        # Peak is tracked as counts are collected, so no reduction is needed here
+        max_infected = self.datacollector.peak_infected
+        time_to_peak = self.datacollector.peak_step
+        attack_rate = self.cumulative_infected / self.population
         
         return {
             'max_infected': int(max_infected),
@@ -314,12 +575,16 @@ class DisinformationModel(Model):
         Returns:
             Dict mapping archetype to (infected_count, total_count, percentage)
         """
+        pop = self.arrays
+        n_archetypes = len(ARCHETYPE_NAMES)
+        totals = np.bincount(pop.archetype_code, minlength=n_archetypes)
+        infected_counts = np.bincount(pop.archetype_code[pop.state == I], minlength=n_archetypes)
+        
         rates = {}
         
-        for archetype_name in ARCHETYPES.keys():
-            archetype_agents = [a for a in self.agents if a.archetype == archetype_name]
-            total = len(archetype_agents)
-            infected = len([a for a in archetype_agents if a.state == 'I'])
+        for code, archetype_name in enumerate(ARCHETYPE_NAMES):
+            total = int(totals[code])
+            infected = int(infected_counts[code])
             
             rates[archetype_name] = {
                 'infected': infected,
@@ -348,63 +613,81 @@ class DisinformationModel(Model):
                     }
                 }
         """
+        # Memoized per step: the summary/export code asks for this repeatedly
+        if self._profile_metrics_cache is not None and self._profile_metrics_cache[0] == self.current_step:
+            return self._profile_metrics_cache[1]
+        
+        pop = self.arrays
+        codes = pop.archetype_code
+        n_archetypes = len(ARCHETYPE_NAMES)
+        
+        def per_archetype(weights=None):
+            return np.bincount(codes, weights=weights, minlength=n_archetypes)
+        
+        ever_infected_mask = pop.infection_count > 0
+        totals = per_archetype()
+        ever_infected = per_archetype(ever_infected_mask)
+        total_infections = per_archetype(pop.infection_count)
+        total_recoveries = per_archetype(pop.recovery_count)
+        total_time_in_I = per_archetype(pop.time_in_I)
+        total_relapses = per_archetype(pop.relapse_count)
+        
         results = {}
         
-        for archetype_name in ARCHETYPES.keys():
-            # Get all agents of this archetype
-            agents = [a for a in self.agents if a.archetype == archetype_name]
-            total = len(agents)
+        for code, archetype_name in enumerate(ARCHETYPE_NAMES):
+            total = int(totals[code])
             
             if total == 0:
                 continue
             
-            # Calculate metrics
-            ever_infected = sum(1 for a in agents if a.infection_count > 0)
-            total_infections = sum(a.infection_count for a in agents)
-            total_recoveries = sum(a.recovery_count for a in agents)
-            total_time_in_I = sum(a.time_in_I for a in agents)
-            total_relapses = sum(a.relapse_count for a in agents)
+            n_ever = int(ever_infected[code])
+            n_infections = int(total_infections[code])
+            n_recoveries = int(total_recoveries[code])
             
             # Mean time in I (only among those who were infected)
-            infected_agents = [a for a in agents if a.infection_count > 0]
-            mean_time_in_I = (
-                total_time_in_I / len(infected_agents) 
-                if len(infected_agents) > 0 else 0.0
-            )
+            mean_time_in_I = float(total_time_in_I[code]) / n_ever if n_ever > 0 else 0.0
             
             # Correction rate: % of infections that led to recovery
-            correction_rate = (
-                total_recoveries / total_infections 
-                if total_infections > 0 else 0.0
-            )
-            
-            # Mean relapses per agent
-            mean_relapses = total_relapses / total if total > 0 else 0.0
+            correction_rate = n_recoveries / n_infections if n_infections > 0 else 0.0
             
             results[archetype_name] = {
                 'total_agents': total,
-                'ever_infected': ever_infected,
-                'attack_rate': ever_infected / total if total > 0 else 0.0,
+                'ever_infected': n_ever,
+                'attack_rate': n_ever / total,
                 'mean_time_in_I': mean_time_in_I,
-                'total_infections': total_infections,
-                'total_recoveries': total_recoveries,
+                'total_infections': n_infections,
+                'total_recoveries': n_recoveries,
                 'correction_rate': correction_rate,
-                'mean_relapses': mean_relapses
+                'mean_relapses': float(total_relapses[code]) / total  # avg relapse_count
             }
         
+        self._profile_metrics_cache = (self.current_step, results)
         return results
     
     # ============================================================================
     # HELPER METHODS
     # ============================================================================
     
+    def _count_infected_neighbors(self) -> np.ndarray:
+        """
+        Count infected neighbors of every agent.
+        
+        Returns:
+            int32 array with the number of neighbors in 'I' state per agent
+        """
+        # One sparse matrix-vector product: k = A · 1[state == I]
+        infected = (self.arrays.state == I).astype(np.int32)
+        return self.adjacency @ infected
+    
     @staticmethod
     def _count_state(model: 'DisinformationModel', state: str) -> int:
         """Count agents in specified state."""
-        return sum(1 for a in model.agents if a.state == state)
+        return int(np.count_nonzero(model.arrays.state == STATE_CODES[state]))
     
     @staticmethod
     def _count_infected_archetype(model: 'DisinformationModel', archetype: str) -> int:
         """Count infected agents of specified archetype."""
-        return sum(1 for a in model.agents 
-                  if a.state == 'I' and a.archetype == archetype)
\ No newline at end of file
+        pop = model.arrays
+        return int(np.count_nonzero(
+            (pop.state == I) & (pop.archetype_code == ARCHETYPE_INDEX[archetype])
+        ))
\ No newline at end of file
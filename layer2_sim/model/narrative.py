@@ -7,10 +7,10 @@ Based on literature:
 - Nyhan & Reifler (2010): Identity weight effects
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Narrative:
     """
     Represents a disinformation narrative with four key characteristics.
@@ -20,11 +20,16 @@ class Narrative:
         emotional_intensity (float): Emotional amplification Emo ∈ [0,1]
         identity_weight (float): Identity-relevance Idw ∈ [0,1]
         initial_seeding (float): Initial infection proportion p₀ ∈ [0,1]
+        effective_transmission (float): β_effective = β₀ × (1 + Emo),
+            derived at construction
+    
+    Instances are immutable; build a new Narrative to change parameters.
     """
     baseline_transmission: float  # β₀
     emotional_intensity: float    # Emo
     identity_weight: float        # Idw
     initial_seeding: float        # p₀
+    effective_transmission: float = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate narrative parameters are in valid range."""
@@ -33,13 +38,9 @@ class Narrative:
             value = getattr(self, field_name)
             if not 0 <= value <= 1:
                 raise ValueError(f"{field_name} must be in [0, 1], got {value}")
-    
-    @property
-    def effective_transmission(self) -> float:
-        """
-        Calculate effective transmission rate with emotional amplification.
         
-        Returns:
-            β_effective = β₀ × (1 + Emo)
-        """
-        return self.baseline_transmission * (1 + self.emotional_intensity)
\ No newline at end of file
+        # β_effective = β₀ × (1 + Emo), fixed for the lifetime of the narrative
+        object.__setattr__(
+            self, 'effective_transmission',
+            self.baseline_transmission * (1 + self.emotional_intensity)
+        )
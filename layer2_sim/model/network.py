@@ -0,0 +1,69 @@
+"""
+Scale-free network generation directly in CSR form.
+
+Builds the same Barabási-Albert graph as networkx.barabasi_albert_graph
+(same algorithm and random stream, so identical edges for a given seed)
+without allocating a NetworkX dict-of-dicts graph.
+"""
+
+import random
+from typing import Optional
+
+import numpy as np
+from scipy import sparse
+
+
+def barabasi_albert_csr(n: int, m: int, seed: Optional[int] = None) -> sparse.csr_array:
+    """
+    Generate a Barabási-Albert preferential-attachment graph as a CSR matrix.
+
+    Mirrors networkx.barabasi_albert_graph: start from a star on m + 1 nodes,
+    then attach each new node to m distinct existing nodes drawn uniformly
+    from a list holding every node once per incident edge.
+
+    Args:
+        n: Number of nodes
+        m: Edges added per new node (1 <= m < n)
+        seed: Seed for the stdlib Random stream (None = global random state)
+
+    Returns:
+        Symmetric CSR adjacency with int32 entries and int32 indptr/indices
+    """
+    if m < 1 or m >= n:
+        raise ValueError(f"Barabási-Albert network must have m >= 1 and m < n, m = {m}, n = {n}")
+
+    rng = random.Random(seed) if seed is not None else random
+    choice = rng.choice
+
+    # Edge list: star (0 - 1..m), then m edges per added node
+    n_edges = m + (n - m - 1) * m
+    src = np.empty(n_edges, dtype=np.int32)
+    dst = np.empty(n_edges, dtype=np.int32)
+    src[:m] = 0
+    dst[:m] = np.arange(1, m + 1)
+
+    # Nodes repeated once per incident edge (star: hub m times, leaves once)
+    repeated_nodes = [0] * m + list(range(1, m + 1))
+
+    e = m
+    for source in range(m + 1, n):
+        targets = set()
+        while len(targets) < m:
+            targets.add(choice(repeated_nodes))
+        src[e:e + m] = source
+        dst[e:e + m] = list(targets)
+        e += m
+        repeated_nodes.extend(targets)
+        repeated_nodes.extend([source] * m)
+
+    # Both directions of every edge, sorted by (row, column)
+    rows = np.concatenate([src, dst])
+    cols = np.concatenate([dst, src])
+    order = np.lexsort((cols, rows))
+
+    indptr = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    indices = cols[order]
+    data = np.ones(len(indices), dtype=np.int32)
+
+    return sparse.csr_array((data, indices, indptr), shape=(n, n))
@@ -0,0 +1,73 @@
+"""
+Struct-of-arrays storage for agent state and traits.
+
+Every per-agent quantity lives in one contiguous NumPy array indexed by
+agent id, so SEIRS transitions can be evaluated for the whole population
+with vectorized expressions instead of per-agent Python calls.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+# Integer state encoding (index into STATE_NAMES)
+S, E, I, R = 0, 1, 2, 3
+STATE_NAMES = ('S', 'E', 'I', 'R')
+STATE_CODES = {name: code for code, name in enumerate(STATE_NAMES)}
+
+
+@dataclass
+class PopulationArrays:
+    """
+    Population state held as parallel arrays (one entry per agent).
+
+    Attributes:
+        state (np.ndarray): Current SEIRS state as int8 (0=S, 1=E, 2=I, 3=R)
+        archetype_code (np.ndarray): Archetype as int8 index into ARCHETYPE_NAMES
+        nfc (np.ndarray): Need for cognition [0,1]
+        trust (np.ndarray): Institutional trust [0,1]
+        cb (np.ndarray): Confirmation bias [0,1]
+        ia (np.ndarray): Identity alignment [0,1]
+        infection_count (np.ndarray): Number of times entered I state
+        recovery_count (np.ndarray): Number of times I → R
+        relapse_count (np.ndarray): Number of times R → S
+        time_in_I (np.ndarray): Cumulative timesteps in I state
+        current_I_duration (np.ndarray): Current infection spell duration
+    """
+    state: np.ndarray
+    archetype_code: np.ndarray
+    nfc: np.ndarray
+    trust: np.ndarray
+    cb: np.ndarray
+    ia: np.ndarray
+    infection_count: np.ndarray
+    recovery_count: np.ndarray
+    relapse_count: np.ndarray
+    time_in_I: np.ndarray
+    current_I_duration: np.ndarray
+
+    @classmethod
+    def allocate(cls, n: int) -> 'PopulationArrays':
+        """
+        Allocate arrays for a population of n susceptible agents.
+
+        Args:
+            n: Population size
+
+        Returns:
+            PopulationArrays with zeroed traits and counters
+        """
+        return cls(
+            state=np.full(n, S, dtype=np.int8),
+            archetype_code=np.zeros(n, dtype=np.int8),
+            nfc=np.zeros(n, dtype=np.float32),
+            trust=np.zeros(n, dtype=np.float32),
+            cb=np.zeros(n, dtype=np.float32),
+            ia=np.zeros(n, dtype=np.float32),
+            infection_count=np.zeros(n, dtype=np.int32),
+            recovery_count=np.zeros(n, dtype=np.int32),
+            relapse_count=np.zeros(n, dtype=np.int32),
+            time_in_I=np.zeros(n, dtype=np.int32),
+            current_I_duration=np.zeros(n, dtype=np.int32),
+        )
@@ -0,0 +1,147 @@
+"""
+Transition probability calculations for the SEIRS disinformation model.
+
+Each function accepts trait values as scalars or NumPy arrays, so the same
+formulas serve a single agent and the whole population at once.
+"""
+
+import numpy as np
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .narrative import Narrative
+
+
+def calculate_alpha(nfc, trust, cb, ia, narrative: 'Narrative'):
+    """
+    Calculate exposure susceptibility (S → E rate).
+
+    α = β₀ × (1 + Emo) × susceptibility_multiplier
+
+    Agent trait effects:
+    - High NFC → reduces exposure (critical filtering)
+    - High CB → increases exposure (motivated seeking)
+    - High IA → increases exposure (identity-motivated)
+
+    Args:
+        nfc, trust, cb, ia: Agent traits (scalars or arrays)
+        narrative: Narrative parameters
+
+    Returns:
+        Probability of exposure per infected neighbor
+    """
+    # Base transmission with emotional amplification
+    base = narrative.effective_transmission
+
+    # Agent-specific susceptibility multiplier
+    effect = (
+        -0.6 * (nfc - 0.5) +      # High NFC filters
+        0.0 * (trust - 0.5) +     # Trust neutral for exposure
+        +0.4 * (cb - 0.5) +       # High CB seeks congruent content
+        +0.3 * (ia - 0.5) * narrative.identity_weight  # Identity-motivated
+    )
+
+    susceptibility = np.clip(1.0 + effect, 0.1, 2.0)
+
+    alpha = base * susceptibility
+    return np.clip(alpha, 0.0, 1.0)
+
+
+def calculate_sigma(nfc, trust, cb, ia, narrative: 'Narrative', sigma_base: float):
+    """
+    Calculate adoption rate (E → I).
+
+    σ = σ₀ × adoption_multiplier
+
+    Agent trait effects:
+    - High NFC → reduces adoption (scrutiny)
+    - High Trust → reduces adoption (trusts debunking)
+    - High CB → increases adoption (reduced scrutiny)
+    - High IA × Idw → amplifies adoption (identity-protective)
+
+    Args:
+        nfc, trust, cb, ia: Agent traits (scalars or arrays)
+        narrative: Narrative parameters
+        sigma_base: Base adoption rate σ₀
+
+    Returns:
+        Probability of adoption per timestep
+    """
+    # Agent-specific adoption multiplier
+    effect = (
+        -0.7 * (nfc - 0.5) +      # High NFC scrutinizes
+        -0.5 * (trust - 0.5) +    # High trust resists
+        +0.6 * (cb - 0.5) +       # High CB reduces scrutiny
+        +1.0 * (ia - 0.5) * narrative.identity_weight  # Identity amplification
+    )
+
+    multiplier = np.clip(1.0 + effect, 0.1, 3.0)
+
+    sigma = sigma_base * multiplier
+    return np.clip(sigma, 0.0, 1.0)
+
+
+def calculate_gamma(nfc, trust, cb, ia, narrative: 'Narrative', gamma_base: float):
+    """
+    Calculate correction rate (I → R).
+
+    γ = γ₀ × (1 + boosts) / (1 + penalties)
+
+    Agent trait effects:
+    - High NFC → increases correction (self-correction)
+    - High Trust → increases correction (accepts authorities)
+    - High CB → reduces correction (resists disconfirmation)
+    - High IA × Idw → reduces correction (identity protection)
+
+    Args:
+        nfc, trust, cb, ia: Agent traits (scalars or arrays)
+        narrative: Narrative parameters
+        gamma_base: Base correction rate γ₀
+
+    Returns:
+        Probability of correction per timestep
+    """
+    # Boosting factors
+    nfc_boost = nfc * 0.8
+    trust_boost = trust * 0.6
+
+    # Penalty factors
+    cb_penalty = cb * 0.5
+    ia_penalty = ia * narrative.identity_weight * 0.8
+
+    multiplier = (1 + nfc_boost + trust_boost) / (1 + cb_penalty + ia_penalty)
+
+    gamma = gamma_base * multiplier
+    return np.clip(gamma, 0.0, 1.0)
+
+
+def calculate_omega(nfc, trust, cb, ia, narrative: 'Narrative', omega_base: float):
+    """
+    Calculate relapse rate (R → S).
+
+    ω = ω₀ × (1 + amplifications) / (1 + protections)
+
+    Agent trait effects:
+    - Low Trust → increases relapse (corrections fade)
+    - High IA × Idw → increases relapse (identity-driven)
+    - High NFC → reduces relapse (sustained revision)
+
+    Args:
+        nfc, trust, cb, ia: Agent traits (scalars or arrays)
+        narrative: Narrative parameters
+        omega_base: Base relapse rate ω₀
+
+    Returns:
+        Probability of relapse per timestep
+    """
+    # Amplification factors
+    trust_penalty = (1 - trust) * 0.6
+    ia_amplification = ia * narrative.identity_weight * 1.0
+
+    # Reduction factors
+    nfc_protection = nfc * 0.4
+
+    multiplier = (1 + trust_penalty + ia_amplification) / (1 + nfc_protection)
+
+    omega = omega_base * multiplier
+    return np.clip(omega, 0.0, 0.2)  # Cap at 20% per timestep
@@ -12,39 +12,35 @@ Features:
 """
 
 import solara
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from pathlib import Path
 import sys
 
-# Add model to path
-current_dir = Path(__file__).parent.parent
+# Add the repository root to path (the model is imported as layer2_sim.model)
+current_dir = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(current_dir))
 
-from model import DisinformationModel, ARCHETYPES, STATE_COLORS
+from layer2_sim.model import (
+    DisinformationModel, ARCHETYPES, ARCHETYPE_COLORS, ARCHETYPE_DIST,
+    ARCHETYPE_DISPLAY_NAMES, STATE_COLORS
+)
+from layer2_sim.visualization.downsample import MAX_PLOT_POINTS, lttb_indices
 
 
 # ============================================================================
 # REACTIVE STATE MANAGEMENT
 # ============================================================================
 
-# Narrative parameters
-narrative_params = solara.reactive({
-    'baseline_transmission': 0.45,
-    'emotional_intensity': 0.70,
-    'identity_weight': 0.75,
-    'initial_seeding': 0.06
-})
-
-# Archetype distribution
-archetype_dist = solara.reactive({
-    'immune': 0.20,
-    'superspreader': 0.15,
-    'moderate': 0.50,
-    'critical_thinker': 0.10,
-    'cynical_contrarian': 0.05
-})
+# Narrative parameters (one reactive per slider, so a slider change only
+# updates that value instead of copying a shared dict)
+baseline_transmission = solara.reactive(0.45)
+emotional_intensity = solara.reactive(0.70)
+identity_weight = solara.reactive(0.75)
+initial_seeding = solara.reactive(0.06)
+
+# Archetype distribution (one reactive per archetype)
+archetype_shares = {name: solara.reactive(share) for name, share in ARCHETYPE_DIST.items()}
 
 # Population & Network
 population_size = solara.reactive(1000)
@@ -67,6 +63,31 @@ random_seed = solara.reactive(42)
 show_advanced = solara.reactive(False)
 
 
+def current_narrative_params() -> dict:
+    """Narrative parameters as the dict DisinformationModel expects."""
+    return {
+        'baseline_transmission': baseline_transmission.value,
+        'emotional_intensity': emotional_intensity.value,
+        'identity_weight': identity_weight.value,
+        'initial_seeding': initial_seeding.value
+    }
+
+
+def current_archetype_dist() -> dict:
+    """Archetype distribution as the dict DisinformationModel expects."""
+    return {name: share.value for name, share in archetype_shares.items()}
+
+
+def model_snapshot(model: DisinformationModel) -> dict:
+    """Everything the result components display, read from the model once."""
+    return {
+        'R0': model.calculate_R0(),
+        'trajectory': model.datacollector.get_model_vars_dataframe(),
+        'metrics': model.get_peak_metrics(),
+        'profile_metrics': model.get_profile_stratified_metrics(),
+    }
+
+
 # ============================================================================
 # MAIN PAGE COMPONENT
 # ============================================================================
@@ -77,6 +98,14 @@ def Page():
     
     solara.Title("SEIRS Disinformation Spread Model - Layer 2: Baseline Simulation")
     
+    # Model reads shared by the result components, redone only when the
+    # model or its step changes rather than once per component per render
+    model = model_instance.value
+    snapshot = solara.use_memo(
+        lambda: model_snapshot(model) if model is not None else None,
+        dependencies=[model, current_step.value]
+    )
+    
     with solara.Column(style={"padding": "20px", "max-width": "1400px", "margin": "0 auto"}):
         
         # Header
@@ -102,12 +131,12 @@ def Page():
             
             # Right column: Visualization & Metrics
             with solara.Column():
-                if model_instance.value is not None:
-                    R0Display()
+                if snapshot is not None:
+                    R0Display(*snapshot['R0'])
                     
                     if current_step.value > 0:
-                        TrajectoryPlot()
-                        MetricsSummary()
+                        TrajectoryPlot(snapshot['trajectory'], model.population)
+                        MetricsSummary(snapshot['metrics'], snapshot['profile_metrics'])
 
 
 # ============================================================================
@@ -123,50 +152,50 @@ def NarrativeControls():
             solara.Markdown("**Baseline Transmission (β₀)**")
             solara.SliderFloat(
                 label="",
-                value=narrative_params.value['baseline_transmission'],
+                value=baseline_transmission.value,
                 min=0.0,
                 max=1.0,
                 step=0.01,
-                on_value=lambda v: narrative_params.set({**narrative_params.value, 'baseline_transmission': v})
+                on_value=baseline_transmission.set
             )
-            solara.Markdown(f"*Current: {narrative_params.value['baseline_transmission']:.2f} - Base contagion rate per contact*")
+            solara.Markdown(f"*Current: {baseline_transmission.value:.2f} - Base contagion rate per contact*")
             
             # Emotional Intensity
             solara.Markdown("**Emotional Intensity (Emo)**")
             solara.SliderFloat(
                 label="",
-                value=narrative_params.value['emotional_intensity'],
+                value=emotional_intensity.value,
                 min=0.0,
                 max=1.0,
                 step=0.01,
-                on_value=lambda v: narrative_params.set({**narrative_params.value, 'emotional_intensity': v})
+                on_value=emotional_intensity.set
             )
-            solara.Markdown(f"*Current: {narrative_params.value['emotional_intensity']:.2f} - Fear, anger, outrage (amplifies transmission)*")
+            solara.Markdown(f"*Current: {emotional_intensity.value:.2f} - Fear, anger, outrage (amplifies transmission)*")
             
             # Identity Weight
             solara.Markdown("**Identity Weight (Idw)**")
             solara.SliderFloat(
                 label="",
-                value=narrative_params.value['identity_weight'],
+                value=identity_weight.value,
                 min=0.0,
                 max=1.0,
                 step=0.01,
-                on_value=lambda v: narrative_params.set({**narrative_params.value, 'identity_weight': v})
+                on_value=identity_weight.set
             )
-            solara.Markdown(f"*Current: {narrative_params.value['identity_weight']:.2f} - Identity-relevance (resists correction)*")
+            solara.Markdown(f"*Current: {identity_weight.value:.2f} - Identity-relevance (resists correction)*")
             
             # Initial Seeding
             solara.Markdown("**Initial Seeding (p₀)**")
             solara.SliderFloat(
                 label="",
-                value=narrative_params.value['initial_seeding'],
+                value=initial_seeding.value,
                 min=0.01,
                 max=0.20,
                 step=0.01,
-                on_value=lambda v: narrative_params.set({**narrative_params.value, 'initial_seeding': v})
+                on_value=initial_seeding.set
             )
-            n_seeded = int(narrative_params.value['initial_seeding'] * population_size.value)
-            solara.Markdown(f"*Current: {narrative_params.value['initial_seeding']:.2f} ({n_seeded} agents start infected)*")
+            n_seeded = int(initial_seeding.value * population_size.value)
+            solara.Markdown(f"*Current: {initial_seeding.value:.2f} ({n_seeded} agents start infected)*")
 
 
 @solara.component
@@ -212,14 +241,15 @@ def ArchetypeControls():
     """Archetype distribution sliders"""
     with solara.Card("🧠 Archetype Distribution", style={"margin-bottom": "15px"}):
         with solara.Column():
-            total = sum(archetype_dist.value.values())
+            total = sum(share.value for share in archetype_shares.values())
             
             for archetype_name, archetype_info in ARCHETYPES.items():
-                color = archetype_info['color']
+                color = ARCHETYPE_COLORS[archetype_name]
                 desc = archetype_info['description']
-                current_val = archetype_dist.value[archetype_name]
+                share = archetype_shares[archetype_name]
+                current_val = share.value
                 
-                solara.Markdown(f"**{color} {archetype_name.replace('_', ' ').title()}**")
+                solara.Markdown(f"**{color} {ARCHETYPE_DISPLAY_NAMES[archetype_name]}**")
                 solara.Markdown(f"*{desc}*")
                 solara.SliderFloat(
                     label="",
@@ -227,10 +257,7 @@ def ArchetypeControls():
                     min=0.0,
                     max=1.0,
                     step=0.05,
-                    on_value=lambda v, name=archetype_name: archetype_dist.set({
-                        **archetype_dist.value,
-                        name: v
-                    })
+                    on_value=share.set
                 )
                 solara.Markdown(f"*{current_val:.0%} ({int(current_val * population_size.value)} agents)*")
             
@@ -348,10 +375,8 @@ def AdvancedSettings():
 # ============================================================================
 
 @solara.component
-def R0Display():
+def R0Display(R0: float, components: dict):
     """Display R₀ calculation"""
-    model = model_instance.value
-    R0, components = model.calculate_R0()
     
     with solara.Card("📈 Theoretical Prediction (R₀)", style={"margin-bottom": "15px"}):
         if R0 > 1:
@@ -375,40 +400,74 @@ def R0Display():
         """)
 
 
+# Trajectory column -> (line color, legend label)
+TRAJECTORY_SERIES = {
+    'Susceptible': ('g', 'Susceptible (S)'),
+    'Exposed': ('y', 'Exposed (E)'),
+    'Infected': ('r', 'Infected (I)'),
+    'Recovered': ('b', 'Recovered (R)'),
+}
+
+
+def _new_trajectory_figure():
+    """
+    Create the trajectory Figure with its styling and one empty line per series.
+    
+    Imports matplotlib on first use. Layout is constrained, so redraws only
+    update line data and limits instead of re-running tight_layout.
+    """
+    from matplotlib.figure import Figure
+    
+    fig = Figure(figsize=(12, 6), layout='constrained')
+    ax = fig.add_subplot()
+    
+    for color, label in TRAJECTORY_SERIES.values():
+        ax.plot([], [], color=color, label=label, linewidth=2.5, alpha=0.8)
+    
+    ax.set_xlabel('Timesteps', fontsize=13, fontweight='bold')
+    ax.set_ylabel('Number of Agents', fontsize=13, fontweight='bold')
+    ax.set_title('SEIRS State Dynamics', fontsize=15, fontweight='bold', pad=15)
+    ax.legend(loc='best', fontsize=11, framealpha=0.9)
+    ax.grid(True, alpha=0.25, linestyle='--')
+    return fig
+
+
+def _draw_trajectories(fig, df: pd.DataFrame, population: int):
+    """Update the Figure's S/E/I/R lines and axis limits from a trajectory."""
+    ax = fig.axes[0]
+    
+    # Long runs are reduced with LTTB so drawing cost stays bounded; the
+    # union of each series' kept points gives one shared x for all four, so
+    # each series gets an equal share of MAX_PLOT_POINTS
+    steps = df.index.to_numpy()
+    values = df[list(TRAJECTORY_SERIES)].to_numpy()
+    n_out = MAX_PLOT_POINTS // len(TRAJECTORY_SERIES)
+    keep = np.unique(np.concatenate([
+        lttb_indices(steps, values[:, i], n_out) for i in range(values.shape[1])
+    ]))
+    
+    for i, line in enumerate(ax.lines):
+        line.set_data(steps[keep], values[keep, i])
+    
+    ax.set_xlim(0, steps[-1])
+    ax.set_ylim(0, population * 1.05)
+
+
 @solara.component
-def TrajectoryPlot():
+def TrajectoryPlot(df: pd.DataFrame, population: int):
     """Plot state trajectories over time"""
-    model = model_instance.value
-    df = model.datacollector.get_model_vars_dataframe()
+    # One Figure per component instance, with its lines updated in place; it
+    # is only re-rendered to an image when the data changes
+    fig = solara.use_memo(_new_trajectory_figure, dependencies=[])
+    _draw_trajectories(fig, df, population)
     
     with solara.Card("📊 State Trajectories Over Time", style={"margin-bottom": "15px"}):
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        ax.plot(df.index, df['Susceptible'], 'g-', label='Susceptible (S)', linewidth=2.5, alpha=0.8)
-        ax.plot(df.index, df['Exposed'], 'y-', label='Exposed (E)', linewidth=2.5, alpha=0.8)
-        ax.plot(df.index, df['Infected'], 'r-', label='Infected (I)', linewidth=2.5, alpha=0.8)
-        ax.plot(df.index, df['Recovered'], 'b-', label='Recovered (R)', linewidth=2.5, alpha=0.8)
-        
-        ax.set_xlabel('Timesteps', fontsize=13, fontweight='bold')
-        ax.set_ylabel('Number of Agents', fontsize=13, fontweight='bold')
-        ax.set_title('SEIRS State Dynamics', fontsize=15, fontweight='bold', pad=15)
-        ax.legend(loc='best', fontsize=11, framealpha=0.9)
-        ax.grid(True, alpha=0.25, linestyle='--')
-        ax.set_xlim(0, max(df.index))
-        ax.set_ylim(0, model.population * 1.05)
-        
-        plt.tight_layout()
-        solara.FigureMatplotlib(fig)
-        plt.close(fig)
+        solara.FigureMatplotlib(fig, dependencies=[df, population])
 
 
 @solara.component
-def MetricsSummary():
-    """Display peak metrics and archetype infection rates"""
-    model = model_instance.value
-    metrics = model.get_peak_metrics()
-    rates = model.get_archetype_infection_rates()
-    profile_metrics = model.get_profile_stratified_metrics()
+def MetricsSummary(metrics: dict, profile_metrics: dict):
+    """Display peak metrics and profile-stratified outcomes"""
     
     with solara.Card("📋 Metrics Summary", style={"margin-bottom": "15px"}):
         solara.Markdown(f"""
@@ -421,34 +480,26 @@ def MetricsSummary():
 ### Profile-Stratified Outcomes
         """)
         
-        # Table header
-        solara.Markdown("""
-| Profile | Attack Rate | Mean Time in I | Correction Rate |
-|---------|-------------|----------------|-----------------|""")
-        
-        for archetype_name, data in profile_metrics.items():
-            color = ARCHETYPES[archetype_name]['color']
-            display_name = archetype_name.replace('_', ' ').title()
-            
-            attack_rate_pct = data['attack_rate'] * 100
-            mean_time = data['mean_time_in_I']
-            correction_rate_pct = data['correction_rate'] * 100
-            
-            solara.Markdown(
-                f"| {color} **{display_name}** | "
-                f"{attack_rate_pct:.1f}% | "
-                f"{mean_time:.1f} steps | "
-                f"{correction_rate_pct:.1f}% |"
-            )
+        # Whole table as one Markdown document (one component instead of one per row)
+        table_rows = "".join(
+            f"| {ARCHETYPE_COLORS[archetype_name]} "
+            f"**{ARCHETYPE_DISPLAY_NAMES[archetype_name]}** | "
+            f"{data['attack_rate'] * 100:.1f}% | "
+            f"{data['mean_time_in_I']:.1f} steps | "
+            f"{data['correction_rate'] * 100:.1f}% |\n"
+            for archetype_name, data in profile_metrics.items()
+        )
+        solara.Markdown(
+            "| Profile | Attack Rate | Mean Time in I | Correction Rate |\n"
+            "|---------|-------------|----------------|-----------------|\n"
+            + table_rows
+        )
         
         # Additional details in collapsible section
         with solara.Details("📊 Detailed Profile Metrics"):
-            for archetype_name, data in profile_metrics.items():
-                color = ARCHETYPES[archetype_name]['color']
-                display_name = archetype_name.replace('_', ' ').title()
-                
-                solara.Markdown(f"""
-**{color} {display_name}**
+            solara.Markdown("\n".join(
+                f"""
+**{ARCHETYPE_COLORS[archetype_name]} {ARCHETYPE_DISPLAY_NAMES[archetype_name]}**
 - Total agents: {data['total_agents']}
 - Ever infected: {data['ever_infected']} ({data['attack_rate']:.1%})
 - Total infection episodes: {data['total_infections']}
@@ -456,7 +507,9 @@ def MetricsSummary():
 - Correction rate: {data['correction_rate']:.1%} (recoveries/infections)
 - Mean relapses per agent: {data['mean_relapses']:.2f}
 - Mean time in Infected state: {data['mean_time_in_I']:.1f} timesteps
-                """)
+"""
+                for archetype_name, data in profile_metrics.items()
+            ))
 
 
 
@@ -467,15 +520,16 @@ def MetricsSummary():
 def create_model():
     """Create a new model instance"""
     # Validate archetype distribution
-    total = sum(archetype_dist.value.values())
+    dist = current_archetype_dist()
+    total = sum(dist.values())
     if abs(total - 1.0) > 0.01:
         solara.Error(f"Archetype distribution must sum to 100% (currently {total:.0%})")
         return
     
     try:
         model = DisinformationModel(
-            narrative_params=narrative_params.value,
-            archetype_dist=archetype_dist.value,
+            narrative_params=current_narrative_params(),
+            archetype_dist=dist,
             population=population_size.value,
             m_edges=m_edges.value,
             seeding_strategy=seeding_strategy.value,
@@ -503,8 +557,8 @@ def run_simulation():
         model = model_instance.value
         model.run(max_steps=max_steps.value)
         
+        # Step change re-renders the page and refreshes the shared snapshot
         current_step.set(model.current_step)
-        model_instance.set(model)  # Force update
         
         metrics = model.get_peak_metrics()
         solara.Success(f"✅ Simulation complete! Peak: {metrics['max_infected']} infected at step {metrics['time_to_peak']}")
@@ -530,14 +584,14 @@ def export_results():
         import sys
         from pathlib import Path
         
-        # Add analysis module to path
-        current_dir = Path(__file__).parent.parent
+        # Add the repository root to path
+        current_dir = Path(__file__).parent.parent.parent
         sys.path.insert(0, str(current_dir))
         
-        from analysis.export import export_simulation_results
+        from layer2_sim.analysis.export import export_simulation_results
         
         model = model_instance.value
-        narrative_name = f"N_beta{narrative_params.value['baseline_transmission']:.2f}_emo{narrative_params.value['emotional_intensity']:.2f}"
+        narrative_name = f"N_beta{baseline_transmission.value:.2f}_emo{emotional_intensity.value:.2f}"
         
         created_files = export_simulation_results(
             model=model,
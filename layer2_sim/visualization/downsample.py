@@ -0,0 +1,67 @@
+"""
+Trajectory downsampling for plotting.
+
+Largest-Triangle-Three-Buckets (LTTB; Steinarsson, 2013) keeps the points
+that best preserve a line's visual shape, so long trajectories can be drawn
+with a bounded number of points.
+"""
+
+import numpy as np
+
+
+# Maximum points drawn per trajectory series
+MAX_PLOT_POINTS = 2000
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int = MAX_PLOT_POINTS) -> np.ndarray:
+    """
+    Select the indices of at most n_out points of a series with LTTB.
+
+    The first and last points are always kept. The interior is split into
+    n_out - 2 equal buckets, and from each bucket the point forming the
+    largest triangle with the previously kept point and the mean of the next
+    bucket is kept.
+
+    Args:
+        x: Sample positions (increasing), e.g. steps
+        y: Sample values
+        n_out: Number of points to keep
+
+    Returns:
+        Sorted integer indices into x and y (all indices if len(x) <= n_out)
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # Bucket b covers [edges[b], edges[b + 1]); first and last points excluded
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+
+        # Mean of the next bucket (the last point for the final bucket)
+        if b + 2 < len(edges):
+            next_lo, next_hi = hi, edges[b + 2]
+            avg_x = x[next_lo:next_hi].mean()
+            avg_y = y[next_lo:next_hi].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        # Twice the triangle area (a, candidate, next-bucket mean)
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        indices[b + 1] = a
+
+    return indices
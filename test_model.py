@@ -2,14 +2,13 @@
 Simple test to verify the model runs correctly.
 """
 
-import sys
-from pathlib import Path
-
-current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir / "layer2_sim"))
+import networkx as nx
 
 from layer2_sim.model import DisinformationModel  # model/model.py
 from layer2_sim.model import ARCHETYPES      # model/archetypes.py
+from layer2_sim.model.network import barabasi_albert_csr
+from layer2_sim.model.kernels import NUMBA_AVAILABLE
+from layer2_sim.analysis import batch_run
 
 # Test parameters
 narrative_params = {
@@ -21,41 +20,86 @@ narrative_params = {
 
 archetype_dist = {name: ARCHETYPES[name]['distribution'] for name in ARCHETYPES.keys()}
 
-print("Creating model...")
-model = DisinformationModel(
-    narrative_params=narrative_params,
-    archetype_dist=archetype_dist,
-    population=100,  # Small for quick test
-    m_edges=3,
-    seed=42
-)
-
-print(f"Model created with {model.population} agents")
-print(f"Initial infected: {model._count_state(model, 'I')}")
-
-# Calculate R0
-R0, components = model.calculate_R0()
-print(f"\nR₀ = {R0:.2f}")
-print(f"  Mean α: {components['mean_alpha']:.3f}")
-print(f"  Mean σ: {components['mean_sigma']:.3f}")
-print(f"  Mean degree: {components['mean_degree']:.1f}")
-print(f"  Infectious period: {components['infectious_period']:.1f} steps")
-
-# Run simulation
-print("\nRunning simulation for 50 steps...")
-model.run(max_steps=50)
-
-# Get metrics
-metrics = model.get_peak_metrics()
-print(f"\nPeak Metrics:")
-print(f"  Max infected: {metrics['max_infected']} ({metrics['max_infected_pct']:.1%})")
-print(f"  Time to peak: {metrics['time_to_peak']} steps")
-print(f"  Attack rate: {metrics['attack_rate']:.1%}")
-
-# Archetype infection rates
-print(f"\nArchetype Infection Rates:")
-rates = model.get_archetype_infection_rates()
-for archetype, data in rates.items():
-    print(f"  {archetype}: {data['infected']}/{data['total']} ({data['percentage']:.1%})")
-
-print("\n✅ Test completed successfully!")
\ No newline at end of file
+
+def main():
+    """Run the model and the consistency checks."""
+    print("Creating model...")
+    model = DisinformationModel(
+        narrative_params=narrative_params,
+        archetype_dist=archetype_dist,
+        population=100,  # Small for quick test
+        m_edges=3,
+        seed=42
+    )
+
+    print(f"Model created with {model.population} agents")
+    print(f"Initial infected: {model._count_state(model, 'I')}")
+
+    # Calculate R0
+    R0, components = model.calculate_R0()
+    print(f"\nR₀ = {R0:.2f}")
+    print(f"  Mean α: {components['mean_alpha']:.3f}")
+    print(f"  Mean σ: {components['mean_sigma']:.3f}")
+    print(f"  Mean degree: {components['mean_degree']:.1f}")
+    print(f"  Infectious period: {components['infectious_period']:.1f} steps")
+
+    # Run simulation
+    print("\nRunning simulation for 50 steps...")
+    model.run(max_steps=50)
+
+    # Get metrics
+    metrics = model.get_peak_metrics()
+    print(f"\nPeak Metrics:")
+    print(f"  Max infected: {metrics['max_infected']} ({metrics['max_infected_pct']:.1%})")
+    print(f"  Time to peak: {metrics['time_to_peak']} steps")
+    print(f"  Attack rate: {metrics['attack_rate']:.1%}")
+
+    # Archetype infection rates
+    print(f"\nArchetype Infection Rates:")
+    rates = model.get_archetype_infection_rates()
+    for archetype, data in rates.items():
+        print(f"  {archetype}: {data['infected']}/{data['total']} ({data['percentage']:.1%})")
+
+    # Network generator must match networkx edge for edge
+    print(f"\nChecking CSR network against networkx...")
+    for n, m, seed in [(100, 3, 42), (500, 2, 7), (1000, 5, 0)]:
+        csr = barabasi_albert_csr(n, m, seed)
+        expected = nx.to_scipy_sparse_array(nx.barabasi_albert_graph(n, m, seed), nodelist=range(n))
+        assert (csr != expected).nnz == 0, f"BA network differs from networkx for n={n}, m={m}, seed={seed}"
+        print(f"  n={n}, m={m}, seed={seed}: identical")
+
+    # Numba kernel and NumPy fallback must produce the same trajectory
+    print(f"\nChecking JIT kernel against NumPy path...")
+    if NUMBA_AVAILABLE:
+        trajectories = {}
+        for use_jit in (True, False):
+            check = DisinformationModel(
+                narrative_params=narrative_params,
+                archetype_dist=archetype_dist,
+                population=500,
+                m_edges=3,
+                seed=7,
+                use_jit=use_jit
+            )
+            check.run(max_steps=50)
+            trajectories[use_jit] = check.datacollector.get_model_vars_dataframe()
+        assert trajectories[True].equals(trajectories[False]), "JIT and NumPy trajectories differ"
+        print(f"  {len(trajectories[True])} steps identical")
+    else:
+        print("  Skipped: numba is not installed (NumPy path only)")
+
+    # Worker processes must import the model through the layer2_sim package
+    print(f"\nChecking batch_run through the layer2_sim package...")
+    batch = batch_run([
+        dict(narrative_params=narrative_params, archetype_dist=archetype_dist,
+             population=100, m_edges=3, seed=42, max_steps=50)
+    ], max_workers=1)
+    assert batch.loc[0, 'peak_infected'] == metrics['max_infected'], "batch_run result differs from a direct run"
+    print(f"  Peak infected: {batch.loc[0, 'peak_infected']} (matches direct run)")
+
+    print("\n✅ Test completed successfully!")
+
+
+# Guarded: batch_run workers re-import this script on spawn-based platforms
+if __name__ == "__main__":
+    main()